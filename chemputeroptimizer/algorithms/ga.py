@@ -1,7 +1,5 @@
 """Genetic Algorithm"""
 
-import random
-
 import numpy as np
 
 from ..algorithms import AbstractAlgorithm
@@ -17,6 +15,7 @@ class GA(AbstractAlgorithm):
     Hyperparameters:
         pop_size (int): Population size
         mutation_rate (float): Probability (0 to 1) of mutating a gene
+        random_state (int, optional): Seed for the random generator
 
     Other Attributes:
         num_genes (int): Number of genes
@@ -30,7 +29,8 @@ class GA(AbstractAlgorithm):
 
     DEFAULT_CONFIG = {
         "pop_size": 8,
-        "mutation_rate": 0.3
+        "mutation_rate": 0.3,
+        "random_state": None,
     }
 
     def __init__(self, dimensions=None, config=None):
@@ -54,20 +54,31 @@ class GA(AbstractAlgorithm):
         self.elit_result = None
         self.counter = 0
         self.generation = 0
+        self.rng = np.random.default_rng(self.config['random_state'])
 
     def initialise(self):
         """Initialise population via random sampling."""
-        self.population = np.empty((0, self.num_genes))
-
-        ind = np.empty((1, self.num_genes))
-        for _ in range(self.pop_size):
-            for gene, bounds in enumerate(self.dimensions):
-                if isinstance(bounds[0], float):
-                    rand_num = np.around(np.random.uniform(low=bounds[0], high=bounds[1]), 2)
-                elif isinstance(bounds[0], int):
-                    rand_num = np.random.randint(low=bounds[0], high=bounds[1]+1)
-                ind[0][gene] = rand_num
-            self.population = np.vstack((self.population, ind))
+        lows = np.array([bounds[0] for bounds in self.dimensions])
+        highs = np.array([bounds[1] for bounds in self.dimensions])
+        integer_genes = np.array(
+            [isinstance(bounds[0], int) for bounds in self.dimensions],
+            dtype=bool,
+        )
+
+        # Drawing all genes at once, float genes are rounded as before
+        self.population = np.around(
+            self.rng.uniform(
+                low=lows, high=highs, size=(self.pop_size, self.num_genes)),
+            2
+        )
+
+        # Integer genes are drawn inclusively of the upper bound
+        if integer_genes.any():
+            self.population[:, integer_genes] = self.rng.integers(
+                low=lows[integer_genes].astype(np.int64),
+                high=highs[integer_genes].astype(np.int64) + 1,
+                size=(self.pop_size, int(integer_genes.sum())),
+            )
 
         return self.population
 
@@ -76,11 +87,15 @@ class GA(AbstractAlgorithm):
 
         self.parents = np.empty((0, self.num_genes))
 
-        # sort unique solutions by fitness (minimum)
-        fit_idx = np.argsort(fitness, axis=0).flatten().tolist()
+        fitness = np.ravel(fitness)
+        num_parents = min(self.num_parents, fitness.size)
+
+        # truncation selection, fittest (minimum) solutions
+        # parents are shuffled for crossover, so their order is irrelevant
+        # and partial partitioning is enough instead of the full sort
+        fit_idx = np.argpartition(fitness, num_parents - 1)[:num_parents]
 
-        # truncation selection
-        self.parents = params[fit_idx[:self.num_parents]]
+        self.parents = params[fit_idx]
 
         return self.parents
 
@@ -93,10 +108,10 @@ class GA(AbstractAlgorithm):
         while len(parents) > 1:
 
             # ensure random pairing
-            np.random.shuffle(parents)
+            self.rng.shuffle(parents)
 
             # random crossover point
-            crossover_point = np.random.randint(1, self.num_genes)
+            crossover_point = self.rng.integers(1, self.num_genes)
 
             # draw parents without replacement
             parent1, parents = parents[-1], parents[:-1]
@@ -118,18 +133,18 @@ class GA(AbstractAlgorithm):
         individuals = np.vstack((self.parents, self.offspring))
 
         for _ in range(individuals.size):
-            if (np.random.rand() < self.mutation_rate):
+            if (self.rng.random() < self.mutation_rate):
                 # select individual
-                rand_ind = random.randrange(0, individuals.shape[0])
+                rand_ind = self.rng.integers(0, individuals.shape[0])
                 # select gene
-                rand_gene = random.randrange(0, self.num_genes)
+                rand_gene = self.rng.integers(0, self.num_genes)
                 # select random reset
                 if isinstance(self.dimensions[rand_gene][0], float):
-                    rand_num = np.around(np.random.uniform(
+                    rand_num = np.around(self.rng.uniform(
                         low=self.dimensions[rand_gene][0],
                         high=self.dimensions[rand_gene][1]), 2)
                 elif isinstance(self.dimensions[rand_gene][0], int):
-                    rand_num = np.random.randint(
+                    rand_num = self.rng.integers(
                         low=self.dimensions[rand_gene][0],
                         high=self.dimensions[rand_gene][1]+1)
 
@@ -147,9 +162,10 @@ class GA(AbstractAlgorithm):
 
         # handle premature convergence
         if self.counter > 1000:
-            print(f"Genetic algorithm converged.")
-            print(f"Best result: {self.elit_result} for {self.elit}")
-            print(f"Randomly reset population with elit.")
+            self.logger.info('Genetic algorithm converged.')
+            self.logger.debug('Best result: %s for %s', self.elit_result,
+                              self.elit)
+            self.logger.info('Randomly reset population with elit.')
             restart = self.initialise()
             self.population = np.vstack((restart[:-1], self.elit))
 
@@ -195,8 +211,10 @@ class GA(AbstractAlgorithm):
             self.suggestions = np.unique(self.suggestions, axis=0)
 
             # drop previously evaluated points
+            evaluated = set(map(tuple, parameters.tolist()))
             self.suggestions = np.array(
-                [i for i in self.suggestions.tolist() if i not in parameters.tolist()])
+                [i for i in self.suggestions.tolist()
+                 if tuple(i) not in evaluated])
 
             # counter to check for premature convergence
             if self.suggestions.size == 0:
@@ -39,12 +39,17 @@ class Random_(AbstractAlgorithm):
         self.logger.debug('Random optimizer for the following parameters: \n\
 parameters: %s\nresults: %s\nconstraints: %s\n',
                           parameters, results, constraints)
-        # Forging new setup
-        new_setup = []
-        for _ in range(n_returns):
-            new_setup.append(
-                [round(self.rng.uniform(a, b), 2) for a, b in constraints]
-            )
-
-        # Casting to numpy array
-        return numpy.array(new_setup)
+        # Splitting constraints into lower and upper bounds
+        # Casting to list first, as constraints may be given as dict values
+        constraints = numpy.asarray(list(constraints), dtype=float)
+        lows, highs = constraints[:, 0], constraints[:, 1]
+
+        # Forging new setup in a single vectorized call
+        return numpy.around(
+            self.rng.uniform(
+                low=lows,
+                high=highs,
+                size=(n_returns, len(constraints))
+            ),
+            2
+        )
@@ -23,12 +23,13 @@ class SMBO(AbstractAlgorithm):
         "base_estimator": "GP",
         "acq_func": "EI",
         "n_initial_points": 5,
+        # space filling design for the initial points, instead of "random"
+        "initial_point_generator": "lhs",
         # below are defaults for the skopt Optimizer
         "acq_optimizer": "auto",
         "random_state": None,
         "acq_func_kwargs": None,
         "acq_optimizer_kwargs": None,
-        "initial_point_generator":"random"
     }
 
     def __init__(self, dimensions, config=None):
@@ -47,20 +48,18 @@ class SMBO(AbstractAlgorithm):
         n_batches: int = 1,
         n_returns: int = 1,
     ):
-        # Negating results, if present
-        # Since skopt optimizer assumes minimization of the cost function
-        if results is not None and isinstance(results, numpy.ndarray):
-            results = -results # pylint: disable=invalid-unary-operand-type
-
         # If all experiments should be taken into account
         if n_batches == -1:
             n_batches = 0
 
         if parameters is not None and results is not None:
             # Use last n_batches for "telling" the optimizer
+            # All of them are told at once, so the model is refitted once
             parameters = parameters[-n_batches:].tolist()
             # Casting from column vector
-            results = results[-n_batches:, 0].tolist()
+            # Negating only the told results, since skopt optimizer assumes
+            # minimization of the cost function
+            results = (-numpy.asarray(results)[-n_batches:, 0]).tolist()
 
             self.skopt_optimizer.tell(parameters, results)
 
@@ -1,38 +1,38 @@
 """Module contains all necessary constants for the ChemputerOptimizer."""
 
 SUPPORTED_STEPS_PARAMETERS = {
-    'Add': {
+    'Add': frozenset({
         "volume",
         "time",
         "dispense_speed",
-    },
-    'AddSolid': {
+    }),
+    'AddSolid': frozenset({
         "mass",
-    },
-    'HeatChill': {
+    }),
+    'HeatChill': frozenset({
         "time",
         "temp",
-    },
-    'HeatChillToTemp': {
+    }),
+    'HeatChillToTemp': frozenset({
         "temp",
-    },
-    'Stir': {
+    }),
+    'Stir': frozenset({
         "time",
-    },
-    'Wait': {
+    }),
+    'Wait': frozenset({
         "time",
-    }
+    })
 }
 
-SUPPORTED_ANALYTICAL_METHODS = [
+SUPPORTED_ANALYTICAL_METHODS = frozenset({
     'HPLC',
     'Raman',
     'NMR',
     # 'pH',
     'interactive',
-]
+})
 
-SUPPORTED_FINAL_ANALYSIS_STEPS = [
+SUPPORTED_FINAL_ANALYSIS_STEPS = frozenset({
     # 'Dry',
     # 'Evaporate',
     # 'Filter',
@@ -40,7 +40,7 @@ SUPPORTED_FINAL_ANALYSIS_STEPS = [
     'Wait',
     'HeatChill',
     'HeatChillToTemp',
-]
+})
 
 ANALYTICAL_INSTRUMENTS = {
     'Raman': 'OceanOpticsRaman',
@@ -51,11 +51,11 @@ ANALYTICAL_INSTRUMENTS = {
 
 # Spectra objects that have special methods for analysis
 # And calculation of the corresponding loss function
-SUPPORTED_SPECTRA_FOR_ANALYSIS = [
+SUPPORTED_SPECTRA_FOR_ANALYSIS = frozenset({
     'spinsolvenmrspectrum',
     'ramanspectrum',
     'agilenthplcchromatogram',
-]
+})
 
 TARGET_PARAMETERS = [
     # 'final_yield',
@@ -19,6 +19,7 @@ from chempiler.tools.graph import load_graph
 from .platform import OptimizerPlatform
 from .platform.steps import (
     OptimizeDynamicStep,
+    OptimizeStep,
     Analyze,
 )
 from .platform.steps.utils import (
@@ -115,10 +116,10 @@ class ChemputerOptimizer():
         final_analysis_steps = []
 
         for i, step in enumerate(self._xdl_object.steps):
-            if step.name == 'FinalAnalysis' or step.name == 'Analyze':
+            # FinalAnalysis is a subclass of Analyze
+            if isinstance(step, Analyze):
                 # Building reference step dictionary
-                reference_step_name = self._xdl_object.steps[i - 1].name
-                if reference_step_name == 'OptimizeStep':
+                if isinstance(self._xdl_object.steps[i - 1], OptimizeStep):
                     # Stripping to the children step
                     reference_step = self._xdl_object.steps[i - 1].children[0]
                 else:
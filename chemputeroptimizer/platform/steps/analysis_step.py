@@ -41,18 +41,18 @@ from ...constants import (
 )
 
 
-NO_PREPARATION_STEPS = [
+NO_PREPARATION_STEPS = frozenset({
     'HeatChill',
     'HeatChillToTemp',
     'Wait',
     'Stir',
-]
+})
 
 # Analysis methods that don't need cleaning upon completion
-NO_CLEANING_NEEDED_METHODS = [
+NO_CLEANING_NEEDED_METHODS = frozenset({
     'interactive',
     'Raman',
-]
+})
 
 # sample constants
 PRIMING_WASTE_VOLUME = 1 # to prime the tubing while acquiring sample
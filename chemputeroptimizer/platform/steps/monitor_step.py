@@ -1,11 +1,13 @@
 import time
 from typing import List, Callable, Optional, Dict, Any
 
+import numpy as np
 from networkx import MultiDiGraph
 
 from xdl.errors import XDLError
 from xdl.steps.base_steps import AbstractStep, AbstractDynamicStep, Step
 from xdl.steps.special_steps import Async, Await
+from AnalyticalLabware.analysis.base_spectrum import AbstractSpectrum
 from chemputerxdl.steps import HeatChill, HeatChillToTemp, Wait, StopHeatChill, Transfer, StartStir, Stir
 from chemputeroptimizer.platform.steps.utils import find_instrument
 from chemputeroptimizer.platform.steps import RunRaman
@@ -78,12 +80,25 @@ class Monitor(AbstractDynamicStep):
         else:
             raise NotImplementedError(f"{method} is not a supported method.")
 
-    def _on_analysis_finish(self, result: List[float]):
+    def _on_analysis_finish(self, result: AbstractSpectrum):
         """Check if reaction is done according to the difference in the current
         and last analysis spectrum. Set state['done'] to True if rxn is complete.
         Set state['current_state'] to the new spectrum.
         """
-        pass
+        spectrum = np.asarray(result.y, dtype=float)
+        current = self.state['current_state']
+
+        # Comparing only if previous non-empty spectrum of the same size
+        # is present
+        if self.time and spectrum.size and len(current) == spectrum.size:
+            # Maximum absolute change, relative to the previous spectrum
+            delta = np.max(np.abs(current - spectrum))
+            # Only setting the flag, as it may be already set when the
+            # monitored step is finished
+            if delta < self.threshold * np.max(np.abs(current)):
+                self.state['done'] = True
+
+        self.state['current_state'] = spectrum
 
     def _on_child_finish(self):
         """Check if reaction is done according to the difference in the current
@@ -8,6 +8,7 @@ Main dynamic step to run iterative reaction optimization.
 import logging
 import json
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import List, Callable, Optional, Dict, Any
@@ -27,6 +28,10 @@ from AnalyticalLabware.devices import chemputer_devices
 from AnalyticalLabware.analysis.base_spectrum import AbstractSpectrum
 
 # Relative
+from .optimize_step import OptimizeStep
+from .constrained_step import ConstrainedStep
+from .analysis_step import Analyze
+from .async_monitor_step import StartMonitoring
 from .utils import (
     forge_xdl_batches,
     extract_optimization_params,
@@ -36,9 +41,7 @@ from .utils import (
 )
 from ...constants import (
     BATCH_1,
-)
-from ...constants import (
-    BATCH_1,
+    CURRENT_VALUE,
 )
 from ...utils import (
     SpectraAnalyzer,
@@ -165,6 +168,9 @@ class OptimizeDynamicStep(AbstractDynamicStep):
         # Tracking of flask usage
         self._previous_volume = get_volumes(graph=graph)
 
+        # Last saved working xdl and its path, see save_batch
+        self._saved_working_xdl: Optional[tuple[XDL, Path]] = None
+
         # Resetting the state
         self._reset_state()
 
@@ -207,15 +213,9 @@ class OptimizeDynamicStep(AbstractDynamicStep):
         new_setup = self.algorithm_class.get_next_setup()
 
         # Updating self.parameters to the new setup
-        for batch_id, batch_setup in new_setup.items():
-            # Batchwise!
-            for step_id, param_value in batch_setup.items():
-                self.parameters[batch_id][step_id].update(
-                    current_value = param_value,
-                )
+        self._update_parameters(new_setup)
 
-        self.logger.debug('New parameters from algorithm:\n %s',
-                          dict(new_setup))
+        self.logger.debug('New parameters from algorithm:\n %s', new_setup)
 
         # Forging xdl batch
         xdl_batches = forge_xdl_batches(
@@ -276,16 +276,28 @@ class OptimizeDynamicStep(AbstractDynamicStep):
         )
 
         # Updating parameters dictionary
-        for batch_id, batch_setup in new_setup.items():
-            # Batchwise!
-            for step_id, param_value in batch_setup.items():
-                self.parameters[batch_id][step_id].update(
-                    current_value = param_value,
-                )
+        self._update_parameters(new_setup)
 
         # Forging and returning the xdls list
         return forge_xdl_batches(self.original_xdl, self.parameters)
 
+    def _update_parameters(
+        self,
+        new_setup: Dict[str, Dict[str, float]],
+    ) -> None:
+        """Update current values of the parameters with the new setup.
+
+        Args:
+            new_setup (Dict[str, Dict[str, float]]): New parameter values as
+                returned by the algorithm, grouped by batch.
+        """
+
+        # Batchwise!
+        for batch_id, batch_setup in new_setup.items():
+            batch_parameters = self.parameters[batch_id]
+            for record, param_value in batch_setup.items():
+                batch_parameters[record][CURRENT_VALUE] = param_value
+
     def _reset_state(self) -> None:
         """Reset the step's state to the initial values."""
 
@@ -338,21 +350,21 @@ class OptimizeDynamicStep(AbstractDynamicStep):
     def _update_constrained_steps(self):
         """Updates the constrained steps"""
         constrained = None
-        updated_value = None
         osteps = []
 
         # find constrained step
         for step in self.working_xdl.steps:
-            if step.name == "ConstrainedStep":
-                relevant_ids = step.ids
+            if isinstance(step, ConstrainedStep):
                 constrained = step
-                updated_value = constrained.target
-            elif step.name == "OptimizeStep":
+            elif isinstance(step, OptimizeStep):
                 osteps.append(step)
 
         if not constrained:
             return
 
+        relevant_ids = constrained.ids
+        updated_value = constrained.target
+
         # find relevant optimize steps
         for step in osteps:
             if int(step.id) in relevant_ids:
@@ -374,7 +386,8 @@ class OptimizeDynamicStep(AbstractDynamicStep):
             """Recursive function to traverse down the steps and assign given
             callback to the found FinalAnalysis or Analyze step."""
 
-            if step.name == 'FinalAnalysis' or step.name == 'Analyze':
+            # FinalAnalysis is a subclass of Analyze
+            if isinstance(step, Analyze):
                 nonlocal analysis_method
                 analysis_method = step.method
                 if analysis_method == 'interactive':
@@ -384,7 +397,7 @@ class OptimizeDynamicStep(AbstractDynamicStep):
                 return
 
             # Adding necessary callbacks for the monitoring step
-            if step.name == 'StartMonitoring':
+            if isinstance(step, StartMonitoring):
                 step.on_going = self._on_monitoring_update
                 step.on_finish = self._on_monitoring_finish
 
@@ -430,7 +443,7 @@ class OptimizeDynamicStep(AbstractDynamicStep):
             # All necessary updates wrapped in single method
             self.on_iteration_complete()
 
-            if self._check_termination():
+            if self.state['done']:
                 return []
 
             return self.on_continue()
@@ -439,7 +452,7 @@ class OptimizeDynamicStep(AbstractDynamicStep):
         except AttributeError:
 
             # If optimization is over
-            if self._check_termination():
+            if self.state['done']:
                 return []
 
             steps = self.working_xdl.steps
@@ -620,10 +633,15 @@ class OptimizeDynamicStep(AbstractDynamicStep):
                 #TODO: additional logic here if needed
                 pass
 
-            # Updating xdls for the next round of iterations
-            self.update_steps_parameters()
             self._update_state()
 
+            # Querying the algorithm and preparing the xdls for the next
+            # round of iterations only if optimization is not over
+            if self._check_termination():
+                self.state['done'] = True
+            else:
+                self.update_steps_parameters()
+
         # Reset async steps
         # This is very important to prevent accumulating async steps from
         # Previous iterations
@@ -790,10 +808,17 @@ class OptimizeDynamicStep(AbstractDynamicStep):
         working_xdl_path = batch_path.joinpath(
             xdl_path.stem + f'_{self.state["iteration"]}.xdl'
         )
-        self.working_xdl.save(working_xdl_path)
+        # All batches within iteration share the same working xdl
+        # So it is serialized once and copied for the other batches
+        if (self._saved_working_xdl is not None
+                and self._saved_working_xdl[0] is self.working_xdl):
+            shutil.copyfile(self._saved_working_xdl[1], working_xdl_path)
+        else:
+            self.working_xdl.save(working_xdl_path)
+            self._saved_working_xdl = (self.working_xdl, working_xdl_path)
 
         self.logger.info('XDL for %s is saved to %s', batch_id,
-                         batch_file_path.absolute())
+                         working_xdl_path.absolute())
 
         if spec:
             # Hack to save spectrum in proper folder
@@ -3,8 +3,10 @@
 import typing
 import copy
 from typing import Optional
+from functools import lru_cache
 from itertools import chain
 from logging import Logger
+from weakref import WeakKeyDictionary
 
 from xdl import XDL
 from xdl.hardware import Hardware
@@ -18,6 +20,7 @@ from chemputerxdl.utils.execution import get_vessel_stirrer
 
 from ...constants import ANALYTICAL_INSTRUMENTS
 from .steps_analysis.constants import SHIMMING_SOLVENTS
+from .optimize_step import OptimizeStep
 
 # For type annotations
 if typing.TYPE_CHECKING:
@@ -31,6 +34,11 @@ SAFETY_EXCESS_VOLUME = 1.5  # 20 %
 # Input messages
 USER_INPUT_MESSAGE = 'Please {} {} and press Enter to continue\n'
 
+# Graph node classes mapped to the first node of that class, per graph
+# Built once per graph, as hardware is not changed during the run
+_GRAPH_CLASSES_INDEX: 'WeakKeyDictionary[MultiDiGraph, dict[str, str]]' = \
+    WeakKeyDictionary()
+
 def deep_copy_step(step: 'Step'):
     """Deprecated. Step.__deepcopy__ now implemented so you can just do
     ``copy.deepcopy(step)``. This remains here for backwards compatibility
@@ -57,6 +65,18 @@ def deep_copy_step(step: 'Step'):
 
     return copied_step
 
+def _copy_properties(properties: dict) -> dict:
+    """Copy properties dictionary, deep copying only mutable values.
+
+    Reagents and hardware properties are mostly immutable scalars (str, float,
+    bool, None), so a full copy.deepcopy is unnecessary for them.
+    """
+    return {
+        key: (value if isinstance(value, (str, int, float, bool, type(None)))
+              else copy.deepcopy(value))
+        for key, value in properties.items()
+    }
+
 def xdl_copy(xdl_obj: 'XDL') -> 'XDL':
     """Deprecated. XDL.__deepcopy__ now implemented so you can just do
     ``copy.deepcopy(xdl_obj)``. This remains here for backwards compatibility
@@ -71,23 +91,20 @@ def xdl_copy(xdl_obj: 'XDL') -> 'XDL':
     Returns:
         XDL: Deep copy of xdl_obj.
     """
-    copy_steps = []
-    copy_reagents = []
-    copy_hardware = []
-
     # Copy steps
-    for step in xdl_obj.steps:
-        copy_steps.append(deep_copy_step(step))
-
-    # Copy reagents
-    for reagent in xdl_obj.reagents:
-        copy_props = copy.deepcopy(reagent.properties)
-        copy_reagents.append(type(reagent)(**copy_props))
-
-    # Copy hardware
-    for component in xdl_obj.hardware:
-        copy_props = copy.deepcopy(component.properties)
-        copy_hardware.append(type(component)(**copy_props))
+    copy_steps = [deep_copy_step(step) for step in xdl_obj.steps]
+
+    # Copy reagents and hardware
+    # Properties are rebuilt from a shallow copy, only mutable values
+    # (e.g. lists) are copied to avoid sharing them with the original
+    copy_reagents = [
+        type(reagent)(**_copy_properties(reagent.properties))
+        for reagent in xdl_obj.reagents
+    ]
+    copy_hardware = [
+        type(component)(**_copy_properties(component.properties))
+        for component in xdl_obj.hardware
+    ]
 
     # Return new XDL object
     return XDL(steps=copy_steps,
@@ -105,9 +122,15 @@ def find_instrument(graph: 'MultiDiGraph', method: str) -> Optional[str]:
     Returns:
         str: ID of the analytical instrument on the supplied graph
     """
-    for node, data in graph.nodes(data=True):
-        if data['class'] == ANALYTICAL_INSTRUMENTS[method]:
-            return node
+    try:
+        classes_index = _GRAPH_CLASSES_INDEX[graph]
+    except KeyError:
+        classes_index = {}
+        for node, data in graph.nodes(data=True):
+            classes_index.setdefault(data.get('class'), node)
+        _GRAPH_CLASSES_INDEX[graph] = classes_index
+
+    return classes_index.get(ANALYTICAL_INSTRUMENTS[method])
 
 def find_last_meaningful_step(
         procedure: list['Step'],
@@ -230,7 +253,7 @@ def extract_optimization_params(
     # It'll be same for all batches, but updated later batch-wise
     param_template = {}
     for i, step in enumerate(xdl.steps):
-        if step.name == 'OptimizeStep':
+        if isinstance(step, OptimizeStep):
             param_template.update(
                 {
                     f'{step.children[0].name}_{i}-{param}': {
@@ -242,11 +265,29 @@ def extract_optimization_params(
             )
 
     # Appending parameters batchwise
+    # Each batch gets its own records, so that batches are updated separately
     for batch_number in range(1, batch_size + 1):
-        parameters[f'batch {batch_number}'] = param_template
+        parameters[f'batch {batch_number}'] = {
+            record: dict(record_params)
+            for record, record_params in param_template.items()
+        }
 
     return parameters
 
+@lru_cache(maxsize=None)
+def _parse_parameter_record(record: str) -> tuple[int, str]:
+    """Get the step index and parameter name from the parameter record.
+
+    Records are formatted as "{step_name}_{step_index}-{parameter}", e.g.
+    "HeatChill_1-temp", and are the same for every iteration.
+    """
+    # Slicing for step index
+    step_id = int(record[record.index('_') + 1:record.index('-')])
+    # Slicing for parameter name
+    param = record[record.index('-') + 1:]
+
+    return step_id, param
+
 def forge_xdl_batches(
     xdl: XDL,
     parameters: dict[str, dict[str, dict[str, float]]],
@@ -270,16 +311,13 @@ def forge_xdl_batches(
         new_xdl = xdl_copy(xdl)
 
         # Update the actual steps properties
-        for record in batch_params:
-            # Slicing for step index
-            step_id = int(record[record.index('_') + 1:record.index('-')])
-            # Slicing for parameter name
-            param = record[record.index('-') + 1:]
+        for record, record_params in batch_params.items():
+            step_id, param = _parse_parameter_record(record)
             # Updating the parameter of the copied xdl
             # This step should be the OptimizeStep wrapper with its children
             # As the actual step to change the property
             new_xdl.steps[step_id].children[0].properties[param] = \
-                parameters[batch_id][record]['current_value']
+                record_params['current_value']
 
         # Appending batch id to the FinalAnalysis method if present
         for step in new_xdl.steps:
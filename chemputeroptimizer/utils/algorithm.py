@@ -28,7 +28,7 @@ from ..constants import (
     MAX_VALUE,
 )
 from .client import OptimizerClient, SERVER_SUPPORTED_ALGORITHMS
-from .errors import NoDataError
+from .errors import NoDataError, ParameterError
 
 
 ALGORITHMS = {
@@ -51,6 +51,54 @@ NON_REINITIALIZED_ALGORITHMS = [
 
 DEFAULT_RNG_SEED = 43
 
+# Initial number of rows for the experimental data buffers
+INITIAL_BUFFER_ROWS = 16
+
+
+class _RowBuffer():
+    """Row-wise growing 2D array.
+
+    Rows are written into a preallocated buffer, which capacity is doubled
+    when full, so that appending is amortized O(1) instead of copying the
+    whole matrix on every experiment.
+    """
+
+    def __init__(self, matrix: Optional[np.ndarray] = None) -> None:
+        self._data: np.ndarray = None
+        self._size: int = 0
+
+        if matrix is not None:
+            self.append(matrix)
+
+    @property
+    def array(self) -> Optional[np.ndarray]:
+        """View of the filled rows, None if nothing was appended."""
+        if self._data is None:
+            return None
+        return self._data[:self._size]
+
+    def append(self, rows: Iterable[Iterable[float]]) -> None:
+        """Append rows to the buffer."""
+        rows = np.array(rows, dtype=float, ndmin=2)
+        if rows.size == 0:
+            return
+
+        n_rows = rows.shape[0]
+
+        if self._data is None:
+            self._data = np.empty(
+                (max(INITIAL_BUFFER_ROWS, n_rows), rows.shape[1]))
+
+        elif self._size + n_rows > self._data.shape[0]:
+            # Doubling the capacity
+            capacity = max(2 * self._data.shape[0], self._size + n_rows)
+            data = np.empty((capacity, self._data.shape[1]))
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+        self._data[self._size:self._size + n_rows] = rows
+        self._size += n_rows
+
 
 class AlgorithmAPI():
     """General class to provide interface for algorithmic optimization."""
@@ -65,8 +113,10 @@ class AlgorithmAPI():
         self.setup_constraints: Dict[str, Tuple(float, float)] = {}
         # Current result parameters
         self.current_result: Dict[str, Dict[str, float]] = {}
-        self.parameter_matrix: np.ndarray = None
-        self.result_matrix: np.ndarray = None
+        # Experimental data, stored in growing buffers
+        # See parameter_matrix and result_matrix properties
+        self._parameters = _RowBuffer()
+        self._results = _RowBuffer()
         self._calculated:  np.ndarray = None
         self.algorithm: AbstractAlgorithm = None
 
@@ -90,6 +140,24 @@ class AlgorithmAPI():
         # Random generator
         self.rng = np.random.default_rng(DEFAULT_RNG_SEED)
 
+    @property
+    def parameter_matrix(self) -> Optional[np.ndarray]:
+        """(n x i) matrix of experimental parameters, None if no data."""
+        return self._parameters.array
+
+    @parameter_matrix.setter
+    def parameter_matrix(self, matrix: Optional[np.ndarray]):
+        self._parameters = _RowBuffer(matrix)
+
+    @property
+    def result_matrix(self) -> Optional[np.ndarray]:
+        """(n x j) matrix of experimental results, None if no data."""
+        return self._results.array
+
+    @result_matrix.setter
+    def result_matrix(self, matrix: Optional[np.ndarray]):
+        self._results = _RowBuffer(matrix)
+
     @property
     def method_name(self) -> str:
         """Name of the selected algorithm."""
@@ -249,20 +317,22 @@ class AlgorithmAPI():
 
         # Stripping input from parameter constraints
         for batch_id, batch_data in data.items():
-            self.current_setup[batch_id] = {}
-            for param, param_set in batch_data.items():
-                self.current_setup[batch_id].update(
-                    {param: param_set[CURRENT_VALUE]}
-                )
+            self.current_setup[batch_id] = {
+                param: param_set[CURRENT_VALUE]
+                for param, param_set in batch_data.items()
+            }
 
         # Saving constraints
+        # Their order defines the order of the parameters (columns)
+        # In the parameter matrix
         if not self.setup_constraints:
             # Using only first batch, assuming:
             # a) it is always present;
             # b) constraints are same across batches
-            for param, param_set in data[BATCH_1].items():
-                self.setup_constraints.update(
-                    {param: (param_set[MIN_VALUE], param_set[MAX_VALUE])})
+            self.setup_constraints = {
+                param: (param_set[MIN_VALUE], param_set[MAX_VALUE])
+                for param, param_set in data[BATCH_1].items()
+            }
 
         # Special case: dealing with novelty search
         # For which the results for all previous experiments
@@ -326,79 +396,57 @@ class AlgorithmAPI():
     def _parse_data(self) -> None:
         """Parse the experimental data.
 
-        Create the following arrays for the first experiment and add the
-        subsequent data as rows:
+        Add the current data as new rows to the following arrays:
             self.parameter_matrix: (n x i) size matrix where n is number of
                 experiments (* by number of batches) and i is number of
                 experimental parameters.
             self.result_matrix: (n x j) size matrix where j is number of the
                 target parameters.
+
+        Raises:
+            ParameterError: If any of the optimized parameters is missing in
+                the batch setup.
         """
 
-        # Loading first value
-        if self.parameter_matrix is None and self.result_matrix is None:
-            parameters: List[List[float]] = []
-            results: List[List[float]] = []
+        parameters: List[List[float]] = []
+        results: List[List[float]] = []
 
-            # Iterating over batches
-            for batch_id in self.current_setup:
-                # List of lists!
-                try:
-                    results.append(
-                        list(self.current_result[batch_id].values()))
-                    parameters.append(
-                        list(self.current_setup[batch_id].values()))
-                except KeyError:
-                    # Happens when preloading results
-                    # and only 1 batch is present
-                    break
-
-            # Converting to arrays
-            # Experiments as rows, data points as columns
-            self.parameter_matrix = np.array(parameters)
-            self.result_matrix = np.array(results)
-
-        # Stacking with previous results
-        else:
-            parameters: List[List[float]] = []
-            results: List[List[float]] = []
+        # Iterating over batches
+        for batch_id, batch_setup in self.current_setup.items():
+            # List of lists!
+            # Both rows are built before appending, so that the matrices
+            # Never get different number of rows
+            try:
+                result_row = list(self.current_result[batch_id].values())
+            except KeyError:
+                # Happens when preloading results
+                # and only 1 batch is present
+                break
 
-            # Iterating over batches
-            for batch_id in self.current_setup:
-                # List of lists!
-                try:
-                    results.append(
-                        list(self.current_result[batch_id].values()))
-                    parameters.append(
-                        list(self.current_setup[batch_id].values()))
-                except KeyError:
-                    # Happens when preloading results
-                    # and only 1 batch is present
-                    break
-
-            # Stacking
-            self.parameter_matrix = np.vstack(
-                (
-                    self.parameter_matrix,
-                    parameters,
-                )
-            )
+            try:
+                # Keeping the parameters order explicitly
+                parameter_row = [
+                    batch_setup[param] for param in self.setup_constraints]
+            except KeyError as error:
+                raise ParameterError(
+                    f'Parameter {error} is missing in {batch_id} setup!'
+                ) from None
 
-            self.result_matrix = np.vstack(
-                (
-                    self.result_matrix,
-                    results,
-                )
-            )
+            results.append(result_row)
+            parameters.append(parameter_row)
+
+        # Experiments as rows, data points as columns
+        self._parameters.append(parameters)
+        self._results.append(results)
 
     def _remap_data(self, data_set: np.ndarray) -> None:
         """Maps the data with the parameters."""
 
         # Iterating over batches
-        for (batch_id, batch_data), data \
-                in zip(self.current_setup.items(), data_set):
-            # Updating
-            self.current_setup[batch_id] = dict(zip(batch_data, data))
+        for batch_id, data in zip(self.current_setup, data_set):
+            # Updating, data columns are in the order of the constraints
+            self.current_setup[batch_id] = dict(
+                zip(self.setup_constraints, data))
 
     def get_next_setup(
         self,
@@ -506,9 +554,8 @@ see below:\n%s', reply['exception'])
 
         header = ''
 
-        # Pick a header from batch 1, assuming all batches have same parameters
-        # And "batch 1" is always present
-        for key in self.current_setup[BATCH_1]:
+        # Parameters are stored in the order of their constraints
+        for key in self.setup_constraints:
             header += f'{key},'
 
         for key in self.current_result[BATCH_1]:
@@ -185,7 +185,6 @@ retrying', DEFAULT_TIMEOUT)
 
     def query(self, data):
         """ Query new data from server. """
-        print(data)
         self._send(data)
         new_data = self._receive()
 
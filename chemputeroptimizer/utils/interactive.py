@@ -162,13 +162,18 @@ def create_optimize_step(
 
     # If no params given, forge them by default
     if params is None:
+        # Reading and casting each property only once
+        values = {
+            param: float(step.properties[param])
+            for param in SUPPORTED_STEPS_PARAMETERS[step.name]
+            if step.properties[param] is not None
+        }
         params = {
             param: {
-                'max_value': float(step.properties[param]) * max_value_range,
-                'min_value': float(step.properties[param]) * min_value_range,
+                'max_value': value * max_value_range,
+                'min_value': value * min_value_range,
             }
-            for param in SUPPORTED_STEPS_PARAMETERS[step.name]
-            if step.properties[param] is not None
+            for param, value in values.items()
         }
 
     # Build an OptimizeStep
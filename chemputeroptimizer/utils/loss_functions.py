@@ -26,7 +26,7 @@ from AnalyticalLabware.devices import AbstractSpectrum
 
 from .utility_functions import (
     general_nmr_processing,
-    find_nearest_value_index,
+    find_nearest_sorted_index,
     find_closest_region,
     find_point_in_regions,
     resolve_point_between_regions,
@@ -359,8 +359,8 @@ fall back to generic loss function.', loss[0], loss[1])
         self.logger.debug('Looking for peak at %s', peak_position)
 
         # Looking for exact point on spectrum
-        _, peak_index = find_nearest_value_index(spectrum.x,
-                                                float(peak_position))
+        peak_index = find_nearest_sorted_index(spectrum.x,
+                                               float(peak_position))
         peak_index_region = find_point_in_regions(regions,
                                                     peak_index)
 
@@ -5,8 +5,6 @@ import warnings
 
 import numpy as np
 
-from AnalyticalLabware.analysis.utils import find_nearest_value_index
-
 from .processing_constants import (
     DEFAULT_NMR_REGIONS_DETECTION,
     DEFAULT_NMR_REFERENCING_METHOD,
@@ -39,6 +37,9 @@ def find_point_in_regions(regions, point):
         # regions[1] -> [7, 12]
     """
 
+    # Contiguous array for the fast vectorized comparisons
+    regions = np.ascontiguousarray(regions)
+
     # If 0 regions given, just return empty array
     if not regions.size > 0:
         return np.array([], dtype='int64')
@@ -78,11 +79,12 @@ def resolve_point_between_regions(regions, point, method='mean'):
     """
 
     if method == 'mean':
-        # Compute mean along vertical axis
-        regions_means = regions.mean(axis=1)
-        # Compute absolute differences
-        diff_map = np.abs(regions_means - point)
-        return regions[np.argmin(diff_map)]
+        # Comparing doubled distances to avoid computing the mean explicitly
+        # |(l + r) / 2 - p| is minimal where |l + r - 2p| is minimal
+        # Borders are cast to float, as unsigned indexes would wrap around
+        borders = regions.astype(np.float64, copy=False)
+        idx = np.argmin(np.abs(borders[:, 0] + borders[:, 1] - 2 * point))
+        return regions[idx]
 
     warnings.warn('Other methods are not supported')
     return regions[-1]
@@ -118,6 +120,9 @@ def find_closest_region(regions, point, method='mean', threshold=0.0):
         array([-114.18, -114.48], dtype=float32)
     """
 
+    # Contiguous array for the fast vectorized reductions
+    regions = np.ascontiguousarray(regions)
+
     if method == 'mean':
         # Computing mean
         regions_ = regions.mean(axis=1)
@@ -131,10 +136,12 @@ def find_closest_region(regions, point, method='mean', threshold=0.0):
         warnings.warn('Other methods are not supported')
         return regions[-1]
 
-    diff_map = np.abs(regions_ - point)
-    if not (diff_map < threshold).any():
+    # Single pass to find the closest region
+    # Then only checking the winner against the threshold
+    idx = np.argmin(np.abs(regions_ - point))
+    if abs(regions_[idx] - point) >= threshold:
         return np.array([])
-    return regions[np.argmin(diff_map)]
+    return regions[idx]
 
 def normalize(self, data, peak, mode='height'):
     """Normalizes the spectrum with respect to a peak."""
@@ -145,6 +152,39 @@ def normalize(self, data, peak, mode='height'):
     else:
         raise NotImplementedError("Mode not supported.")
 
+def find_nearest_sorted_index(array, value):
+    """ Help function to find index of the value closest to the given one.
+
+    Same as find_nearest_value_index from AnalyticalLabware, but for
+    monotonic (ascending or descending) arrays, e.g. spectrum x axis. Uses
+    binary search instead of computing the distances for the whole array.
+
+    Args:
+        array (:obj:np.array): 1D monotonic array.
+        value (float): Value of interest.
+
+    Returns:
+        int: Index of the array element closest to the value.
+
+    Example:
+        >>> find_nearest_sorted_index(np.array([10, 8, 6, 4]), 5.2)
+        2
+    """
+
+    # Searching in ascending order
+    descending = array[0] > array[-1]
+    if descending:
+        array = array[::-1]
+
+    idx = int(np.searchsorted(array, value))
+
+    # Comparing with the left neighbor
+    if idx == len(array) or (
+            idx > 0 and value - array[idx - 1] <= array[idx] - value):
+        idx -= 1
+
+    return len(array) - 1 - idx if descending else idx
+
 ### NMR
 # NMR spectrum-specific processing functions
 
@@ -173,7 +213,7 @@ def general_nmr_processing(
 
     # integrating the reference if given
     if reference is not None:
-        _, reference_index = find_nearest_value_index(spectrum.x, reference)
+        reference_index = find_nearest_sorted_index(spectrum.x, reference)
 
         reference_region_index = find_point_in_regions(regions,
                                                         reference_index)
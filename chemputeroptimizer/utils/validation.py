@@ -3,6 +3,7 @@ Module contains functions to validate various settings for the
 ChemputerOptimizer configuration.
 """
 
+from collections import deque
 from logging import Logger
 from typing import Union
 import warnings
@@ -10,6 +11,7 @@ import warnings
 from xdl import XDL
 
 from .errors import OptimizerError, ParameterError
+from ..platform.steps.optimize_step import OptimizeStep
 from ..constants import (
     SUPPORTED_STEPS_PARAMETERS,
     DEFAULT_OPTIMIZATION_PARAMETERS,
@@ -77,25 +79,28 @@ def find_and_validate_optimize_steps(
 
     optimize_steps: dict[str, dict] = {}
 
-    for step in procedure.steps:
-        if step.name == 'OptimizeStep':
-            # Validating the OptimizeStep child
-            optimized_step = step.children[0].name
-            if optimized_step not in SUPPORTED_STEPS_PARAMETERS:
-                raise OptimizerError(f'Step {optimized_step} is not \
-    supported for optimization')
+    # Only OptimizeStep wrappers are of interest
+    wrapper_steps = (
+        step for step in procedure.steps if isinstance(step, OptimizeStep))
 
-            # Validating target properties for the child step
-            for parameter in step.optimize_properties:
-                if parameter not in SUPPORTED_STEPS_PARAMETERS[optimized_step]:
-                    raise ParameterError(f'Parameter {parameter} is not \
-    supported for step {step}')
+    for step in wrapper_steps:
+        # Validating the OptimizeStep child
+        optimized_step = step.children[0].name
+        supported_parameters = SUPPORTED_STEPS_PARAMETERS.get(optimized_step)
+        if supported_parameters is None:
+            raise OptimizerError(f'Step {optimized_step} is not \
+supported for optimization')
 
-            optimize_steps.update(
-                {f'{optimized_step}_{step.id}': f'{step.optimize_properties}'}
-            )
+        # Validating target properties for the child step
+        for parameter in step.optimize_properties:
+            if parameter not in supported_parameters:
+                raise ParameterError(f'Parameter {parameter} is not \
+supported for step {step}')
 
-            logger.debug('Found OptimizeStep for %s.', optimized_step)
+        optimize_steps[f'{optimized_step}_{step.id}'] = \
+            f'{step.optimize_properties}'
+
+        logger.debug('Found OptimizeStep for %s.', optimized_step)
 
     return optimize_steps
 
@@ -118,50 +123,51 @@ def validate_optimization_config(
             raise ParameterError(
                 f'<{parameter}> not a valid optimization parameter!')
 
-    # Patching target name
-    for target_name in config[TARGET]:
+    # Patching target names
+    # Collecting all targets into a new dictionary to preserve all entries
+    patched_target = {}
+    for target_name, target_value in config[TARGET].items():
         if 'spectrum_peak-area_' in target_name:
             warnings.warn('"spectrum_peak-area_XXX" is obsolete objective \
 name, use "spectrum_peak_area_XXX" instead.', category=FutureWarning)
             *_, peak_position = target_name.split('_')
-            new_target_name = f'spectrum_peak_area_{peak_position}'
-            config[TARGET] = {
-                new_target_name: config[TARGET][target_name]
-            }
+            target_name = f'spectrum_peak_area_{peak_position}'
 
-        if 'spectrum_integration-area_' in target_name:
+        elif 'spectrum_integration-area_' in target_name:
             warnings.warn('"spectrum_integration-area_" is obsolete objective \
 name, use "spectrum_integration_area_" instead.', category=FutureWarning)
             *_, area = target_name.split('_')
-            new_target_name = f'spectrum_integration_area_{area}'
-            config[TARGET] = {
-                new_target_name: config[TARGET][target_name]
-            }
+            target_name = f'spectrum_integration_area_{area}'
+
+        elif 'novelty' in target_name:
+            target_name = NOVELTY
+
+        patched_target[target_name] = target_value
 
-        if 'novelty' in target_name:
-            new_target_name = NOVELTY
-            config[TARGET] = {
-                new_target_name: config[TARGET][target_name]
-            }
+    config[TARGET] = patched_target
 
 def update_configuration(
     config1: dict[str, Union[str, dict]],
     config2: dict[str, Union[str, dict]]
 ) -> None:
-    """Recursively update missing values from two configurations.
+    """Update missing values from two nested configurations.
 
     Args:
         config1 (dict): Configuration dictionary to update.
         config2 (dict): Reference configuration dictionary, to pick up missing
             values from.
     """
-    for key, value in config2.items():
-        if key not in config1:
-            config1[key] = value
-        elif key == TARGET:
-            # Special case - don't update the "target" parameter
-            # Otherwise "final_parameter" from default will be appended
-            pass
-        else:
-            if isinstance(value, dict):
-                update_configuration(config1[key], value)
+    # Walking nested dictionaries iteratively, pairwise
+    pending = deque([(config1, config2)])
+
+    while pending:
+        current, reference = pending.popleft()
+        for key, value in reference.items():
+            if key not in current:
+                current[key] = value
+            elif key == TARGET:
+                # Special case - don't update the "target" parameter
+                # Otherwise "final_parameter" from default will be appended
+                continue
+            elif isinstance(value, dict) and isinstance(current[key], dict):
+                pending.append((current[key], value))
@@ -0,0 +1,47 @@
+"""Running tests on the AlgorithmAPI data handling."""
+
+# pylint: disable-all
+
+import numpy as np
+import pytest
+
+from chemputeroptimizer.utils.algorithm import AlgorithmAPI
+from chemputeroptimizer.utils.errors import ParameterError
+
+
+def get_algorithm_api():
+    algorithm_api = AlgorithmAPI()
+    algorithm_api.setup_constraints = {
+        'A_1-x': (100.0, 200.0),
+        'B_2-y': (0.0, 1.0),
+    }
+    return algorithm_api
+
+@pytest.mark.unit
+def test_remap_data_follows_constraints_order():
+    algorithm_api = get_algorithm_api()
+    # Setup keys order differs from the constraints, e.g. loaded from csv
+    algorithm_api.current_setup = {
+        'batch 1': {'B_2-y': 0.5, 'A_1-x': 150.0},
+    }
+
+    algorithm_api._remap_data(np.array([[143.89, 0.77]]))
+
+    assert algorithm_api.current_setup == {
+        'batch 1': {'A_1-x': 143.89, 'B_2-y': 0.77},
+    }
+
+@pytest.mark.unit
+def test_parse_data_missing_parameter():
+    algorithm_api = get_algorithm_api()
+    algorithm_api.current_setup = {
+        'batch 1': {'A_1-x': 150.0, 'B_2-y': 0.5},
+        'batch 2': {'A_1-x': 120.0},
+    }
+    algorithm_api.current_result = {
+        'batch 1': {'final_yield': 0.5},
+        'batch 2': {'final_yield': 0.6},
+    }
+
+    with pytest.raises(ParameterError):
+        algorithm_api._parse_data()
@@ -0,0 +1,30 @@
+"""Running tests on the local optimization algorithms."""
+
+# pylint: disable-all
+
+import numpy as np
+import pytest
+
+from chemputeroptimizer.algorithms import Random_
+
+
+@pytest.mark.unit
+def test_random_suggest_from_dict_values():
+    # Constraints are passed by AlgorithmAPI as dict values
+    setup_constraints = {
+        'HeatChill_1-temp': (20.0, 80.0),
+        'Add_2-volume': (1.0, 5.0),
+    }
+
+    algorithm = Random_(setup_constraints.values())
+
+    new_setup = algorithm.suggest(
+        constraints=setup_constraints.values(),
+        n_returns=3,
+    )
+
+    assert new_setup.shape == (3, 2)
+    lows, highs = np.array(list(setup_constraints.values())).T
+    assert np.all((new_setup >= lows) & (new_setup <= highs))
+    # Values are rounded to 2 decimals
+    assert np.allclose(new_setup, np.around(new_setup, 2))
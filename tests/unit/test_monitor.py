@@ -0,0 +1,79 @@
+"""Running tests on the Monitor step analysis callback."""
+
+# pylint: disable-all
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from chemputeroptimizer.platform.steps import Monitor
+
+
+def get_monitor_state(time=True, threshold=0.05):
+    # Only attributes used by the callback
+    return SimpleNamespace(
+        time=time,
+        threshold=threshold,
+        state={'current_state': [], 'done': False},
+    )
+
+def get_spectrum(y):
+    # RunRaman passes a spectrum object with intensities in "y"
+    return SimpleNamespace(y=np.array(y, dtype=float))
+
+@pytest.mark.unit
+def test_monitor_first_spectrum_is_stored():
+    monitor = get_monitor_state()
+
+    Monitor._on_analysis_finish(monitor, get_spectrum([1, 2, 3]))
+
+    assert not monitor.state['done']
+    assert np.array_equal(monitor.state['current_state'], [1, 2, 3])
+
+@pytest.mark.unit
+def test_monitor_done_when_spectrum_unchanged():
+    monitor = get_monitor_state()
+
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 30]))
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 30.5]))
+
+    assert monitor.state['done']
+
+@pytest.mark.unit
+def test_monitor_not_done_when_spectrum_changes():
+    monitor = get_monitor_state()
+
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 30]))
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 40]))
+
+    assert not monitor.state['done']
+
+@pytest.mark.unit
+def test_monitor_without_time_never_done():
+    monitor = get_monitor_state(time=False)
+
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 30]))
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 30]))
+
+    assert not monitor.state['done']
+
+@pytest.mark.unit
+def test_monitor_done_not_cleared_by_changing_spectrum():
+    monitor = get_monitor_state()
+
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 30]))
+    # Monitored step is finished before the next spectrum is acquired
+    monitor.state['done'] = True
+    Monitor._on_analysis_finish(monitor, get_spectrum([10, 20, 40]))
+
+    assert monitor.state['done']
+
+@pytest.mark.unit
+def test_monitor_empty_spectra():
+    monitor = get_monitor_state()
+
+    Monitor._on_analysis_finish(monitor, get_spectrum([]))
+    Monitor._on_analysis_finish(monitor, get_spectrum([]))
+
+    assert not monitor.state['done']
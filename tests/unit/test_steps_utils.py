@@ -0,0 +1,30 @@
+"""Running tests on the Optimize Dynamic Step utility functions."""
+
+# pylint: disable-all
+
+from types import SimpleNamespace
+
+import pytest
+
+from chemputerxdl.steps import HeatChill
+
+from chemputeroptimizer.platform.steps import OptimizeStep
+from chemputeroptimizer.platform.steps.utils import extract_optimization_params
+
+
+@pytest.mark.unit
+def test_extract_optimization_params_batches_are_independent():
+    optimize_step = OptimizeStep(
+        id='0',
+        children=[HeatChill(vessel='filter', temp=100, time=1800)],
+        optimize_properties={'temp': {'max_value': 120, 'min_value': 80}},
+    )
+    # Only steps are used to extract the parameters
+    xdl = SimpleNamespace(steps=[optimize_step])
+
+    parameters = extract_optimization_params(xdl, batch_size=2)
+
+    parameters['batch 2']['HeatChill_0-temp']['current_value'] = 90
+
+    assert parameters['batch 1']['HeatChill_0-temp']['current_value'] == 100
+    assert parameters['batch 1']['HeatChill_0-temp']['max_value'] == 120
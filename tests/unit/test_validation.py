@@ -0,0 +1,25 @@
+"""Running tests on the optimization configuration validation."""
+
+# pylint: disable-all
+
+import pytest
+
+from chemputeroptimizer.utils.validation import validate_optimization_config
+
+
+@pytest.mark.unit
+def test_validate_config_keeps_all_targets():
+    config = {
+        'target': {
+            'spectrum_peak-area_150': 0.5,
+            'spectrum_integration_area_100..200': 0.8,
+        },
+    }
+
+    with pytest.warns(FutureWarning):
+        validate_optimization_config(config)
+
+    assert config['target'] == {
+        'spectrum_peak_area_150': 0.5,
+        'spectrum_integration_area_100..200': 0.8,
+    }